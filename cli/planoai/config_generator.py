@@ -1,10 +1,13 @@
 import json
 import os
 import uuid
-from planoai.utils import convert_legacy_listeners
+from functools import lru_cache
+from planoai.utils import YamlLoader, convert_legacy_listeners
 from jinja2 import Environment, FileSystemLoader
 import yaml
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from urllib.parse import urlparse
 from copy import deepcopy
 from planoai.consts import DEFAULT_OTEL_TRACING_GRPC_ENDPOINT
@@ -79,6 +82,11 @@ SUPPORTED_PROVIDERS = (
     SUPPORTED_PROVIDERS_WITHOUT_BASE_URL + SUPPORTED_PROVIDERS_WITH_BASE_URL
 )
 
+# Set views for membership checks; the lists above keep the order used in
+# error messages.
+_SUPPORTED_PROVIDER_SET = frozenset(SUPPORTED_PROVIDERS)
+_BASE_URL_PROVIDER_SET = frozenset(SUPPORTED_PROVIDERS_WITH_BASE_URL)
+
 
 def get_endpoint_and_port(endpoint, protocol):
     endpoint_tokens = endpoint.split(":")
@@ -225,11 +233,7 @@ def validate_and_render_schema():
     with open(PLANO_CONFIG_FILE, "r") as file:
         plano_config = file.read()
 
-    with open(PLANO_CONFIG_SCHEMA_FILE, "r") as file:
-        plano_config_schema = file.read()
-
-    config_yaml = yaml.safe_load(plano_config)
-    _ = yaml.safe_load(plano_config_schema)
+    config_yaml = yaml.load(plano_config, Loader=YamlLoader)
     inferred_clusters = {}
 
     # Convert legacy llm_providers to model_providers
@@ -412,7 +416,7 @@ def validate_and_render_schema():
                     )
 
             # Validate azure_openai and ollama provider requires base_url
-            if (provider in SUPPORTED_PROVIDERS_WITH_BASE_URL) and model_provider.get(
+            if (provider in _BASE_URL_PROVIDER_SET) and model_provider.get(
                 "base_url"
             ) is None:
                 raise Exception(
@@ -422,7 +426,7 @@ def validate_and_render_schema():
             model_id = "/".join(model_name_tokens[1:])
 
             # For wildcard providers, allow any provider name
-            if not is_wildcard and provider not in SUPPORTED_PROVIDERS:
+            if not is_wildcard and provider not in _SUPPORTED_PROVIDER_SET:
                 if (
                     model_provider.get("base_url", None) is None
                     or model_provider.get("provider_interface", None) is None
@@ -431,7 +435,7 @@ def validate_and_render_schema():
                         f"Must provide base_url and provider_interface for unsupported provider {provider} for model {model_name}. Supported providers are: {', '.join(SUPPORTED_PROVIDERS)}"
                     )
                 provider = model_provider.get("provider_interface", None)
-            elif is_wildcard and provider not in SUPPORTED_PROVIDERS:
+            elif is_wildcard and provider not in _SUPPORTED_PROVIDER_SET:
                 # Wildcard models with unsupported providers require base_url and provider_interface
                 if (
                     model_provider.get("base_url", None) is None
@@ -442,7 +446,7 @@ def validate_and_render_schema():
                     )
                 provider = model_provider.get("provider_interface", None)
             elif (
-                provider in SUPPORTED_PROVIDERS
+                provider in _SUPPORTED_PROVIDER_SET
                 and model_provider.get("provider_interface", None) is not None
             ):
                 # For supported providers, provider_interface should not be manually set
@@ -675,6 +679,15 @@ def validate_and_render_schema():
         file.write(plano_config_string)
 
 
+@lru_cache(maxsize=4)
+def _config_schema_validator(plano_config_schema):
+    """Build a checked validator for the schema text, reused for identical text."""
+    schema = yaml.load(plano_config_schema, Loader=YamlLoader)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 def validate_prompt_config(plano_config_file, plano_config_schema_file):
     with open(plano_config_file, "r") as file:
         plano_config = file.read()
@@ -682,11 +695,15 @@ def validate_prompt_config(plano_config_file, plano_config_schema_file):
     with open(plano_config_schema_file, "r") as file:
         plano_config_schema = file.read()
 
-    config_yaml = yaml.safe_load(plano_config)
-    config_schema_yaml = yaml.safe_load(plano_config_schema)
+    config_yaml = yaml.load(plano_config, Loader=YamlLoader)
+    validator = _config_schema_validator(plano_config_schema)
 
     try:
-        validate(config_yaml, config_schema_yaml)
+        # Same error selection as jsonschema.validate, minus the per-call
+        # schema check.
+        error = best_match(validator.iter_errors(config_yaml))
+        if error is not None:
+            raise error
     except ValidationError as e:
         path = (
             " → ".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
@@ -5,7 +5,7 @@ import sys
 import time
 
 import yaml
-from planoai.utils import convert_legacy_listeners, getLogger
+from planoai.utils import YamlLoader, convert_legacy_listeners, getLogger
 from planoai.consts import (
     PLANO_DOCKER_IMAGE,
     PLANO_DOCKER_NAME,
@@ -29,7 +29,7 @@ def _get_gateway_ports(plano_config_file: str) -> list[int]:
     # parse plano_config_file yaml file and get prompt_gateway_port
     plano_config_dict = {}
     with open(plano_config_file) as f:
-        plano_config_dict = yaml.safe_load(f)
+        plano_config_dict = yaml.load(f, Loader=YamlLoader)
 
     model_providers = plano_config_dict.get("llm_providers") or plano_config_dict.get(
         "model_providers"
@@ -279,7 +279,7 @@ def start_cli_agent(
 
     with open(plano_config_file, "r") as file:
         plano_config = file.read()
-        plano_config_yaml = yaml.safe_load(plano_config)
+        plano_config_yaml = yaml.load(plano_config, Loader=YamlLoader)
 
     host, port = _resolve_cli_agent_endpoint(plano_config_yaml)
 
@@ -1,4 +1,3 @@
-import json
 import os
 import multiprocessing
 import subprocess
@@ -21,6 +20,7 @@ from planoai.docker_cli import (
     docker_container_status,
 )
 from planoai.utils import (
+    YamlLoader,
     getLogger,
     get_llm_provider_access_keys,
     load_env_file_to_dict,
@@ -53,6 +53,8 @@ log = getLogger(__name__)
 
 
 def _is_native_plano_running() -> bool:
+    import json
+
     if not os.path.exists(NATIVE_PID_FILE):
         return False
     try:
@@ -441,7 +443,7 @@ def up(
         env.pop("PATH", None)
 
         with open(plano_config_file, "r") as f:
-            plano_config = yaml.safe_load(f)
+            plano_config = yaml.load(f, Loader=YamlLoader)
 
         # Inject ChatGPT tokens from ~/.plano/chatgpt/auth.json if any provider needs them
         _inject_chatgpt_tokens_if_needed(plano_config, env, console)
@@ -156,17 +156,36 @@ def ensure_envoy_binary():
             os.unlink(tmp_path)
 
 
+WASM_PLUGIN_NAMES = ("prompt_gateway.wasm", "llm_gateway.wasm")
+
+
+def _list_file_names(directory):
+    """Return the set of regular file names in *directory* (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _missing_wasm_plugins(wasm_dir):
+    """Return the WASM plugin names not present in *wasm_dir*, using one scan."""
+    names = _list_file_names(wasm_dir)
+    return [name for name in WASM_PLUGIN_NAMES if name not in names]
+
+
 def _find_local_wasm_plugins():
     """Check for WASM plugins built from source. Returns (prompt_gw, llm_gw) or None."""
     repo_root = find_repo_root()
     if not repo_root:
         return None
     wasm_dir = os.path.join(repo_root, "crates", "target", "wasm32-wasip1", "release")
-    prompt_gw = os.path.join(wasm_dir, "prompt_gateway.wasm")
-    llm_gw = os.path.join(wasm_dir, "llm_gateway.wasm")
-    if os.path.exists(prompt_gw) and os.path.exists(llm_gw):
-        return prompt_gw, llm_gw
-    return None
+    if _missing_wasm_plugins(wasm_dir):
+        return None
+    return (
+        os.path.join(wasm_dir, "prompt_gateway.wasm"),
+        os.path.join(wasm_dir, "llm_gateway.wasm"),
+    )
 
 
 def _find_local_brightstaff():
@@ -194,7 +213,7 @@ def ensure_wasm_plugins():
     prompt_gw_path = os.path.join(PLANO_PLUGINS_DIR, "prompt_gateway.wasm")
     llm_gw_path = os.path.join(PLANO_PLUGINS_DIR, "llm_gateway.wasm")
 
-    if os.path.exists(prompt_gw_path) and os.path.exists(llm_gw_path):
+    if not _missing_wasm_plugins(PLANO_PLUGINS_DIR):
         if os.path.exists(version_path):
             with open(version_path, "r") as f:
                 cached_version = f.read().strip()
@@ -210,10 +229,7 @@ def ensure_wasm_plugins():
     # 3. Download from GitHub releases (gzipped)
     os.makedirs(PLANO_PLUGINS_DIR, exist_ok=True)
 
-    for name, dest in [
-        ("prompt_gateway.wasm", prompt_gw_path),
-        ("llm_gateway.wasm", llm_gw_path),
-    ]:
+    for name, dest in zip(WASM_PLUGIN_NAMES, (prompt_gw_path, llm_gw_path)):
         gz_name = f"{name}.gz"
         url = f"{PLANO_RELEASE_BASE_URL}/{version}/{gz_name}"
         gz_dest = dest + ".gz"
@@ -289,12 +305,7 @@ def find_wasm_plugins():
     prompt_gw = os.path.join(wasm_dir, "prompt_gateway.wasm")
     llm_gw = os.path.join(wasm_dir, "llm_gateway.wasm")
 
-    missing = []
-    if not os.path.exists(prompt_gw):
-        missing.append("prompt_gateway.wasm")
-    if not os.path.exists(llm_gw):
-        missing.append("llm_gateway.wasm")
-
+    missing = _missing_wasm_plugins(wasm_dir)
     if missing:
         print(f"Error: WASM plugins not found: {', '.join(missing)}")
         print(f"  Expected at: {wasm_dir}/")
@@ -2,11 +2,16 @@ import contextlib
 import io
 import json
 import os
+import re
+import select
 import signal
 import subprocess
 import sys
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import SimpleNamespace
 
 from planoai.consts import (
     NATIVE_PID_FILE,
@@ -18,12 +23,12 @@ from planoai.native_binaries import (
     ensure_envoy_binary,
     ensure_wasm_plugins,
 )
-from planoai.utils import find_repo_root, getLogger
+from planoai.utils import YamlLoader, find_repo_root, getLogger
 
 log = getLogger(__name__)
 
 
-def _find_config_dir():
+def _find_config_dir(start_path=None):
     """Locate the directory containing plano_config_schema.yaml and envoy.template.yaml.
 
     Checks package data first (pip-installed), then falls back to the repo checkout.
@@ -36,7 +41,7 @@ def _find_config_dir():
     ):
         return pkg_data
 
-    repo_root = find_repo_root()
+    repo_root = find_repo_root(start_path)
     if repo_root:
         config_dir = os.path.join(repo_root, "config")
         if os.path.isdir(config_dir):
@@ -49,6 +54,18 @@ def _find_config_dir():
     sys.exit(1)
 
 
+@lru_cache(maxsize=8)
+def _native_paths(cwd):
+    """Resolve config template and render output paths once per working directory."""
+    config_dir = _find_config_dir(cwd)
+    return SimpleNamespace(
+        config_dir=config_dir,
+        schema_file=os.path.join(config_dir, "plano_config_schema.yaml"),
+        envoy_config_rendered=os.path.join(PLANO_RUN_DIR, "envoy.yaml"),
+        plano_config_rendered=os.path.join(PLANO_RUN_DIR, "plano_config_rendered.yaml"),
+    )
+
+
 @contextlib.contextmanager
 def _temporary_env(overrides):
     """Context manager that sets env vars from *overrides* and restores originals on exit."""
@@ -66,11 +83,32 @@ def _temporary_env(overrides):
                 os.environ[key] = original
 
 
+# Same syntax as posixpath.expandvars: $NAME or ${NAME}.
+_ENV_VAR_RE = re.compile(r"\$(\w+|\{[^}]*\})", re.ASCII)
+
+
+def _expand_env_vars(text, env):
+    """Expand $VAR / ${VAR} from *env*, then os.environ, leaving unknown vars as-is."""
+
+    def _substitute(match):
+        name = match.group(1)
+        if name.startswith("{"):
+            name = name[1:-1]
+        value = env.get(name)
+        if value is None:
+            value = os.environ.get(name)
+        return match.group(0) if value is None else value
+
+    return _ENV_VAR_RE.sub(_substitute, text)
+
+
 def render_native_config(plano_config_file, env, with_tracing=False):
     """Render envoy and plano configs for native mode. Returns (envoy_config_path, plano_config_rendered_path)."""
     import yaml
 
-    os.makedirs(PLANO_RUN_DIR, exist_ok=True)
+    # Creates PLANO_RUN_DIR too; start_native relies on both existing.
+    log_dir = os.path.join(PLANO_RUN_DIR, "logs")
+    os.makedirs(log_dir, exist_ok=True)
 
     prompt_gw_path, llm_gw_path = ensure_wasm_plugins()
 
@@ -78,7 +116,7 @@ def render_native_config(plano_config_file, env, with_tracing=False):
     effective_config_file = os.path.abspath(plano_config_file)
     if with_tracing:
         with open(plano_config_file, "r") as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=YamlLoader)
         tracing = config_data.get("tracing", {})
         if not tracing.get("random_sampling"):
             tracing["random_sampling"] = 100
@@ -89,18 +127,15 @@ def render_native_config(plano_config_file, env, with_tracing=False):
             with open(effective_config_file, "w") as f:
                 yaml.dump(config_data, f, default_flow_style=False)
 
-    envoy_config_path = os.path.join(PLANO_RUN_DIR, "envoy.yaml")
-    plano_config_rendered_path = os.path.join(
-        PLANO_RUN_DIR, "plano_config_rendered.yaml"
-    )
+    paths = _native_paths(os.getcwd())
+    envoy_config_path = paths.envoy_config_rendered
+    plano_config_rendered_path = paths.plano_config_rendered
 
     # Set environment variables that config_generator.validate_and_render_schema() reads
-    config_dir = _find_config_dir()
+    config_dir = paths.config_dir
     overrides = {
         "PLANO_CONFIG_FILE": effective_config_file,
-        "PLANO_CONFIG_SCHEMA_FILE": os.path.join(
-            config_dir, "plano_config_schema.yaml"
-        ),
+        "PLANO_CONFIG_SCHEMA_FILE": paths.schema_file,
         "TEMPLATE_ROOT": config_dir,
         "ENVOY_CONFIG_TEMPLATE_FILE": "envoy.template.yaml",
         "PLANO_CONFIG_FILE_RENDERED": plano_config_rendered_path,
@@ -131,8 +166,6 @@ def render_native_config(plano_config_file, env, with_tracing=False):
     )
 
     # Replace /var/log/ paths with local log directory (non-root friendly)
-    log_dir = os.path.join(PLANO_RUN_DIR, "logs")
-    os.makedirs(log_dir, exist_ok=True)
     envoy_content = envoy_content.replace("/var/log/", log_dir + "/")
 
     # Replace Linux CA cert path with platform-appropriate path
@@ -143,17 +176,18 @@ def render_native_config(plano_config_file, env, with_tracing=False):
             "/etc/ssl/certs/ca-certificates.crt", "/etc/ssl/cert.pem"
         )
 
+    with open(plano_config_rendered_path, "r") as f:
+        plano_content = f.read()
+
+    # Run envsubst-equivalent on both rendered files using the caller's env,
+    # then write each file back exactly once.
+    envoy_content = _expand_env_vars(envoy_content, env)
+    plano_content = _expand_env_vars(plano_content, env)
+
     with open(envoy_config_path, "w") as f:
         f.write(envoy_content)
-
-    # Run envsubst-equivalent on both rendered files using the caller's env
-    with _temporary_env(env):
-        for filepath in [envoy_config_path, plano_config_rendered_path]:
-            with open(filepath, "r") as f:
-                content = f.read()
-            content = os.path.expandvars(content)
-            with open(filepath, "w") as f:
-                f.write(content)
+    with open(plano_config_rendered_path, "w") as f:
+        f.write(plano_content)
 
     return envoy_config_path, plano_config_rendered_path
 
@@ -185,17 +219,16 @@ def start_native(
         progress_callback("Configuration valid...")
 
     log_dir = os.path.join(PLANO_RUN_DIR, "logs")
-    os.makedirs(log_dir, exist_ok=True)
-
     log_level = env.get("LOG_LEVEL", "info")
 
     # Start brightstaff
-    brightstaff_env = os.environ.copy()
-    brightstaff_env["RUST_LOG"] = log_level
-    brightstaff_env["PLANO_CONFIG_PATH_RENDERED"] = plano_config_rendered_path
-    # Propagate API keys and other env vars
-    for key, value in env.items():
-        brightstaff_env[key] = value
+    brightstaff_env = {
+        **os.environ,
+        "RUST_LOG": log_level,
+        "PLANO_CONFIG_PATH_RENDERED": plano_config_rendered_path,
+        # Propagate API keys and other env vars
+        **env,
+    }
 
     brightstaff_pid = _daemon_exec(
         [brightstaff_path],
@@ -225,15 +258,17 @@ def start_native(
         progress_callback(f"Started envoy (PID: {envoy_pid})...")
 
     # Save PIDs
-    os.makedirs(PLANO_RUN_DIR, exist_ok=True)
-    with open(NATIVE_PID_FILE, "w") as f:
-        json.dump(
-            {
-                "envoy_pid": envoy_pid,
-                "brightstaff_pid": brightstaff_pid,
-            },
-            f,
-        )
+    payload = json.dumps(
+        {
+            "envoy_pid": envoy_pid,
+            "brightstaff_pid": brightstaff_pid,
+        }
+    ).encode()
+    pid_fd = os.open(NATIVE_PID_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(pid_fd, payload)
+    finally:
+        os.close(pid_fd)
 
     # Health check
     gateway_ports = _get_gateway_ports(plano_config_file)
@@ -241,41 +276,47 @@ def start_native(
     if progress_callback:
         progress_callback("Waiting for listeners to become healthy...")
 
+    health_endpoints = [f"http://localhost:{port}/healthz" for port in gateway_ports]
     start_time = time.time()
     timeout = 60
-    while True:
-        all_healthy = True
-        for port in gateway_ports:
-            if not health_check_endpoint(f"http://localhost:{port}/healthz"):
-                all_healthy = False
+    # Back off from a short initial delay so readiness is noticed promptly.
+    poll_delay = 0.05
+    # Probe every listener concurrently so a slow port doesn't delay the others.
+    with _open_pidfds((brightstaff_pid, envoy_pid)) as pidfds, ThreadPoolExecutor(
+        max_workers=max(1, len(health_endpoints))
+    ) as health_pool:
+        while True:
+            all_healthy = all(health_pool.map(health_check_endpoint, health_endpoints))
+
+            if all_healthy:
+                log.info("Plano is running (native mode)")
+                for port in gateway_ports:
+                    log.info(f"  http://localhost:{port}")
 
-        if all_healthy:
-            log.info("Plano is running (native mode)")
-            for port in gateway_ports:
-                log.info(f"  http://localhost:{port}")
-
-            break
-
-        # Check if processes are still alive
-        if not _is_pid_alive(brightstaff_pid):
-            log.error("brightstaff exited unexpectedly")
-            log.error(f"  Check logs: {os.path.join(log_dir, 'brightstaff.log')}")
-            _kill_pid(envoy_pid)
-            sys.exit(1)
-
-        if not _is_pid_alive(envoy_pid):
-            log.error("envoy exited unexpectedly")
-            log.error(f"  Check logs: {os.path.join(log_dir, 'envoy.log')}")
-            _kill_pid(brightstaff_pid)
-            sys.exit(1)
-
-        if time.time() - start_time > timeout:
-            log.error(f"Health check timed out after {timeout}s")
-            log.error(f"  Check logs in: {log_dir}")
-            stop_native()
-            sys.exit(1)
+                break
 
-        time.sleep(1)
+            # Check if processes are still alive
+            exited = _exited_pids((brightstaff_pid, envoy_pid), pidfds)
+            if brightstaff_pid in exited:
+                log.error("brightstaff exited unexpectedly")
+                log.error(f"  Check logs: {os.path.join(log_dir, 'brightstaff.log')}")
+                _kill_pid(envoy_pid)
+                sys.exit(1)
+
+            if envoy_pid in exited:
+                log.error("envoy exited unexpectedly")
+                log.error(f"  Check logs: {os.path.join(log_dir, 'envoy.log')}")
+                _kill_pid(brightstaff_pid)
+                sys.exit(1)
+
+            if time.time() - start_time > timeout:
+                log.error(f"Health check timed out after {timeout}s")
+                log.error(f"  Check logs in: {log_dir}")
+                stop_native()
+                sys.exit(1)
+
+            time.sleep(poll_delay)
+            poll_delay = min(poll_delay * 1.5, 1.0)
 
     if foreground:
         log.info("Running in foreground. Press Ctrl+C to stop.")
@@ -307,46 +348,50 @@ def start_native(
 
 
 def _daemon_exec(args, env, log_path):
-    """Start a fully daemonized process via double-fork. Returns the child PID."""
+    """Start a fully daemonized process (fork + setsid + posix_spawn). Returns the child PID."""
     log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    # The intermediate child reports the grandchild PID back through this pipe.
+    pid_r, pid_w = os.pipe()
 
     pid = os.fork()
     if pid > 0:
-        # Parent: close our copy of the log fd and wait for intermediate child
+        # Parent: close our copies of the log fd and pipe write end
         os.close(log_fd)
+        os.close(pid_w)
         os.waitpid(pid, 0)
         # Read the grandchild PID from the pipe
-        grandchild_pid_path = os.path.join(PLANO_RUN_DIR, f".daemon_pid_{pid}")
-        deadline = time.time() + 5
-        while time.time() < deadline:
-            if os.path.exists(grandchild_pid_path):
-                with open(grandchild_pid_path, "r") as f:
-                    grandchild_pid = int(f.read().strip())
-                os.unlink(grandchild_pid_path)
-                return grandchild_pid
-            time.sleep(0.05)
-        raise RuntimeError(f"Timed out waiting for daemon PID from {args[0]}")
-
-    # First child: create new session and fork again
+        try:
+            data = os.read(pid_r, 32)
+        finally:
+            os.close(pid_r)
+        if not data:
+            raise RuntimeError(f"Failed to get daemon PID from {args[0]}")
+        return int(data.decode().strip())
+
+    # First child: create new session and spawn the daemon from it
+    os.close(pid_r)
     os.setsid()
-    grandchild_pid = os.fork()
-    if grandchild_pid > 0:
-        # Intermediate child: write grandchild PID and exit
-        pid_path = os.path.join(PLANO_RUN_DIR, f".daemon_pid_{os.getpid()}")
-        with open(pid_path, "w") as f:
-            f.write(str(grandchild_pid))
-        os._exit(0)
-
-    # Grandchild: this is the actual daemon
-    os.dup2(log_fd, 1)  # stdout -> log
-    os.dup2(log_fd, 2)  # stderr -> log
-    os.close(log_fd)
-    # Close stdin
-    devnull = os.open(os.devnull, os.O_RDONLY)
-    os.dup2(devnull, 0)
-    os.close(devnull)
-
-    os.execve(args[0], args, env)
+    try:
+        # posix_spawn avoids copying the interpreter's address space again and
+        # applies the stdio redirection in the daemon before exec.
+        grandchild_pid = os.posix_spawn(
+            args[0],
+            args,
+            env,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_DUP2, log_fd, 1),  # stdout -> log
+                (os.POSIX_SPAWN_DUP2, log_fd, 2),  # stderr -> log
+            ],
+        )
+    except OSError as e:
+        os.write(log_fd, f"Failed to start {args[0]}: {e}\n".encode())
+        os._exit(1)
+
+    # Intermediate child: write grandchild PID and exit
+    os.write(pid_w, str(grandchild_pid).encode())
+    os.close(pid_w)
+    os._exit(0)
 
 
 def _is_pid_alive(pid):
@@ -360,6 +405,58 @@ def _is_pid_alive(pid):
         return True  # Process exists but we can't signal it
 
 
+@contextlib.contextmanager
+def _open_pidfds(pids):
+    """Yield {pid: pidfd} for *pids* where pidfd_open is supported (Linux 5.3+)."""
+    pidfds = {}
+    if hasattr(os, "pidfd_open"):
+        for pid in pids:
+            try:
+                pidfds[pid] = os.pidfd_open(pid)
+            except OSError:
+                pass
+    try:
+        yield pidfds
+    finally:
+        for fd in pidfds.values():
+            os.close(fd)
+
+
+def _exited_pids(pids, pidfds):
+    """Return the subset of *pids* that have exited.
+
+    PIDs with a pidfd are checked with a single non-blocking select(); any
+    others fall back to _is_pid_alive().
+    """
+    exited = set()
+    if pidfds:
+        readable, _, _ = select.select(list(pidfds.values()), [], [], 0)
+        exited.update(pid for pid, fd in pidfds.items() if fd in readable)
+    exited.update(pid for pid in pids if pid not in pidfds and not _is_pid_alive(pid))
+    return exited
+
+
+def _wait_for_exit(pids, pidfds, timeout):
+    """Wait up to *timeout* seconds for *pids* to exit. Returns those still running.
+
+    When every pending PID has a pidfd this blocks in select() and wakes as
+    soon as a process exits; otherwise it polls every 50ms.
+    """
+    pending = set(pids)
+    deadline = time.time() + timeout
+    while pending:
+        pending -= _exited_pids(pending, pidfds)
+        remaining = deadline - time.time()
+        if not pending or remaining <= 0:
+            break
+        watched = [pidfds[pid] for pid in pending if pid in pidfds]
+        if len(watched) == len(pending):
+            select.select(watched, [], [], remaining)
+        else:
+            time.sleep(min(0.05, remaining))
+    return pending
+
+
 def _kill_pid(pid):
     """Send SIGTERM to a PID, ignoring errors."""
     try:
@@ -389,6 +486,8 @@ def stop_native(skip_pids: set | None = None):
     brightstaff_pid = pids.get("brightstaff_pid")
 
     had_running_process = False
+    # Signal every process first so they shut down in parallel.
+    pending = {}
     for name, pid in [
         ("envoy", envoy_pid),
         ("brightstaff", brightstaff_pid),
@@ -401,6 +500,7 @@ def stop_native(skip_pids: set | None = None):
             os.kill(pid, signal.SIGTERM)
             log.info(f"Sent SIGTERM to {name} (PID {pid})")
             had_running_process = True
+            pending[pid] = name
         except ProcessLookupError:
             log.info(f"{name} (PID {pid}) already stopped")
             continue
@@ -408,21 +508,18 @@ def stop_native(skip_pids: set | None = None):
             log.error(f"Permission denied stopping {name} (PID {pid})")
             continue
 
-        # Wait for graceful shutdown
-        deadline = time.time() + 10
-        while time.time() < deadline:
-            try:
-                os.kill(pid, 0)  # Check if still alive
-                time.sleep(0.5)
-            except ProcessLookupError:
-                break
-        else:
-            # Still alive after timeout, force kill
-            try:
-                os.kill(pid, signal.SIGKILL)
-                log.info(f"Sent SIGKILL to {name} (PID {pid})")
-            except ProcessLookupError:
-                pass
+    # Wait for graceful shutdown against a single shared deadline
+    with _open_pidfds(pending) as pidfds:
+        still_running = _wait_for_exit(pending, pidfds, timeout=10)
+
+    # Still alive after timeout, force kill
+    for pid in still_running:
+        name = pending[pid]
+        try:
+            os.kill(pid, signal.SIGKILL)
+            log.info(f"Sent SIGKILL to {name} (PID {pid})")
+        except ProcessLookupError:
+            pass
 
     os.unlink(NATIVE_PID_FILE)
     if had_running_process:
@@ -434,22 +531,18 @@ def stop_native(skip_pids: set | None = None):
 
 def native_validate_config(plano_config_file):
     """Validate config in-process without Docker."""
-    config_dir = _find_config_dir()
+    paths = _native_paths(os.getcwd())
 
     # Create temp dir for rendered output (we just want validation)
     os.makedirs(PLANO_RUN_DIR, exist_ok=True)
 
     overrides = {
         "PLANO_CONFIG_FILE": os.path.abspath(plano_config_file),
-        "PLANO_CONFIG_SCHEMA_FILE": os.path.join(
-            config_dir, "plano_config_schema.yaml"
-        ),
-        "TEMPLATE_ROOT": config_dir,
+        "PLANO_CONFIG_SCHEMA_FILE": paths.schema_file,
+        "TEMPLATE_ROOT": paths.config_dir,
         "ENVOY_CONFIG_TEMPLATE_FILE": "envoy.template.yaml",
-        "PLANO_CONFIG_FILE_RENDERED": os.path.join(
-            PLANO_RUN_DIR, "plano_config_rendered.yaml"
-        ),
-        "ENVOY_CONFIG_FILE_RENDERED": os.path.join(PLANO_RUN_DIR, "envoy.yaml"),
+        "PLANO_CONFIG_FILE_RENDERED": paths.plano_config_rendered,
+        "ENVOY_CONFIG_FILE_RENDERED": paths.envoy_config_rendered,
     }
 
     with _temporary_env(overrides):
@@ -7,6 +7,7 @@ from pathlib import Path
 import yaml
 
 from planoai.init_cmd import BUILTIN_TEMPLATES
+from planoai.utils import YamlLoader
 
 
 @dataclass(frozen=True)
@@ -23,7 +24,9 @@ SYNC_MAP_PATH = TEMPLATES_DIR / "template_sync_map.yaml"
 
 
 def _load_sync_entries() -> list[SyncEntry]:
-    payload = yaml.safe_load(SYNC_MAP_PATH.read_text(encoding="utf-8")) or {}
+    payload = (
+        yaml.load(SYNC_MAP_PATH.read_text(encoding="utf-8"), Loader=YamlLoader) or {}
+    )
     rows = payload.get("templates", [])
     entries: list[SyncEntry] = []
     for row in rows:
@@ -47,6 +50,13 @@ def _render_for_demo(template_text: str, transform: str) -> str:
     return rendered if rendered.endswith("\n") else f"{rendered}\n"
 
 
+def _read_bytes_or_none(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
 def _validate_manifest(entries: list[SyncEntry]) -> list[str]:
     errors: list[str] = []
     builtin_ids = {t.id for t in BUILTIN_TEMPLATES}
@@ -75,6 +85,30 @@ def _validate_manifest(entries: list[SyncEntry]) -> list[str]:
     return errors
 
 
+def _sync_entry(entry: SyncEntry) -> tuple[int, int, list[str]]:
+    """Write one template's demo configs; returns (written, unchanged, messages)."""
+    template_text = (TEMPLATES_DIR / entry.template_file).read_text(encoding="utf-8")
+    expected_bytes = _render_for_demo(template_text, entry.transform).encode("utf-8")
+
+    written = 0
+    unchanged = 0
+    messages: list[str] = []
+    for demo_rel_path in entry.demo_configs:
+        demo_path = REPO_ROOT / demo_rel_path
+        # Byte-identical demos are already in sync; skip the rewrite.
+        if _read_bytes_or_none(demo_path) == expected_bytes:
+            unchanged += 1
+            messages.append(f"[unchanged] {demo_rel_path}")
+            continue
+        # Keep this as a write-only sync step so CI behavior is deterministic.
+        demo_path.write_bytes(expected_bytes)
+        written += 1
+        messages.append(
+            f"[wrote] {demo_rel_path} <- {entry.template_id} ({entry.template_file})"
+        )
+    return written, unchanged, messages
+
+
 def write_mapped_demo_configs(*, verbose: bool = False) -> int:
     entries = _load_sync_entries()
     manifest_errors = _validate_manifest(entries)
@@ -84,23 +118,19 @@ def write_mapped_demo_configs(*, verbose: bool = False) -> int:
         return 2
 
     write_count = 0
+    unchanged_count = 0
     for entry in entries:
-        template_text = (TEMPLATES_DIR / entry.template_file).read_text(
-            encoding="utf-8"
-        )
-        expected_text = _render_for_demo(template_text, entry.transform)
-
-        for demo_rel_path in entry.demo_configs:
-            demo_path = REPO_ROOT / demo_rel_path
-            # Keep this as a write-only sync step so CI behavior is deterministic.
-            demo_path.write_text(expected_text, encoding="utf-8")
-            write_count += 1
-            if verbose:
-                print(
-                    f"[wrote] {demo_rel_path} <- {entry.template_id} ({entry.template_file})"
-                )
-
-    print(f"Wrote {write_count} mapped demo config(s) from CLI templates.")
+        written, unchanged, messages = _sync_entry(entry)
+        write_count += written
+        unchanged_count += unchanged
+        if verbose:
+            for message in messages:
+                print(message)
+
+    print(
+        f"Wrote {write_count} mapped demo config(s) from CLI templates "
+        f"({unchanged_count} already in sync)."
+    )
     return 0
 
 
@@ -111,7 +141,7 @@ def main() -> int:
     parser.add_argument(
         "--verbose",
         action="store_true",
-        help="Print each file written during sync.",
+        help="Print each demo config written or already in sync.",
     )
     args = parser.parse_args()
 
@@ -1,7 +1,6 @@
 import json
 import os
 import re
-import string
 import subprocess
 import sys
 import threading
@@ -10,8 +9,8 @@ from http import HTTPStatus
 from collections import OrderedDict
 from concurrent import futures
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from fnmatch import fnmatch
+from functools import lru_cache
+from fnmatch import translate
 from typing import Any
 
 import grpc
@@ -20,7 +19,7 @@ from opentelemetry.proto.collector.trace.v1 import (
     trace_service_pb2,
     trace_service_pb2_grpc,
 )
-from rich.console import Console
+from rich.console import Console, Group
 from rich.text import Text
 from rich.tree import Tree
 
@@ -57,8 +56,9 @@ class TraceSummary:
     def timestamp(self) -> str:
         if self.start_ns <= 0:
             return "unknown"
-        dt = datetime.fromtimestamp(self.start_ns / 1_000_000_000, tz=timezone.utc)
-        return dt.astimezone().strftime("%Y-%m-%d %H:%M:%S")
+        return time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.localtime(self.start_ns // 1_000_000_000)
+        )
 
 
 def _is_port_in_use(host: str, port: int) -> bool:
@@ -91,10 +91,14 @@ def _parse_filter_patterns(filter_patterns: tuple[str, ...]) -> list[str]:
     return parts
 
 
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+
 def _is_hex(value: str, length: int) -> bool:
-    if len(value) != length:
+    if len(value) != length or not value.isascii():
         return False
-    return all(char in string.hexdigits for char in value)
+    # Deleting every hex digit must leave nothing behind.
+    return not value.encode("ascii").translate(None, _HEX_DIGITS)
 
 
 def _parse_where_filters(where_filters: tuple[str, ...]) -> list[tuple[str, str]]:
@@ -120,29 +124,17 @@ def _parse_where_filters(where_filters: tuple[str, ...]) -> list[tuple[str, str]
     return parsed
 
 
-def _collect_attr_keys(traces: list[dict[str, Any]]) -> set[str]:
-    keys: set[str] = set()
-    for trace in traces:
-        for span in trace.get("spans", []):
-            for item in span.get("attributes", []):
-                key = item.get("key")
-                if key:
-                    keys.add(str(key))
-    return keys
-
-
 def _fetch_traces_raw() -> list[dict[str, Any]]:
     port = os.environ.get("PLANO_TRACE_PORT", str(DEFAULT_GRPC_PORT))
     target = f"127.0.0.1:{port}"
     try:
-        channel = grpc.insecure_channel(target)
-        stub = channel.unary_unary(
-            "/plano.TraceQuery/GetTraces",
-            request_serializer=lambda x: x,
-            response_deserializer=lambda x: x,
-        )
-        response = stub(b"", timeout=3)
-        channel.close()
+        with grpc.insecure_channel(target) as channel:
+            stub = channel.unary_unary(
+                "/plano.TraceQuery/GetTraces",
+                request_serializer=lambda x: x,
+                response_deserializer=lambda x: x,
+            )
+            response = stub(b"", timeout=3)
         data = json.loads(response)
         traces = data.get("traces", [])
         if isinstance(traces, list):
@@ -152,20 +144,22 @@ def _fetch_traces_raw() -> list[dict[str, Any]]:
     return []
 
 
+_ATTR_VALUE_KEYS = ("stringValue", "intValue", "doubleValue", "boolValue")
+
+
 def _attrs(span: dict[str, Any]) -> dict[str, str]:
+    """Return the span's attributes as ``{key: str(value)}``."""
     attrs = {}
     for item in span.get("attributes", []):
         key = item.get("key")
+        if key is None:
+            continue
         value_obj = item.get("value", {})
-        value = value_obj.get("stringValue")
-        if value is None and "intValue" in value_obj:
-            value = value_obj.get("intValue")
-        if value is None and "doubleValue" in value_obj:
-            value = value_obj.get("doubleValue")
-        if value is None and "boolValue" in value_obj:
-            value = value_obj.get("boolValue")
-        if key is not None and value is not None:
-            attrs[str(key)] = str(value)
+        for value_key in _ATTR_VALUE_KEYS:
+            value = value_obj.get(value_key)
+            if value is not None:
+                attrs[str(key)] = str(value)
+                break
     return attrs
 
 
@@ -195,58 +189,27 @@ def _parse_since_seconds(value: str | None) -> int | None:
     return qty * multiplier
 
 
-def _matches_pattern(value: str, pattern: str) -> bool:
-    if pattern == "*":
-        return True
-    if "*" not in pattern:
-        return value == pattern
-    parts = [part for part in pattern.split("*") if part]
-    if not parts:
-        return True
-    remaining = value
-    for idx, part in enumerate(parts):
-        pos = remaining.find(part)
-        if pos == -1:
-            return False
-        if idx == 0 and not pattern.startswith("*") and pos != 0:
-            return False
-        remaining = remaining[pos + len(part) :]
-    if not pattern.endswith("*") and remaining:
-        return False
-    return True
-
+def _compile_patterns(patterns: list[str]) -> re.Pattern[str]:
+    """Combine glob *patterns* into one anchored regex matching any of them."""
+    return re.compile("|".join(translate(pattern) for pattern in patterns))
 
-def _attribute_map(span: dict[str, Any]) -> dict[str, str]:
-    attrs = {}
-    for item in span.get("attributes", []):
-        key = item.get("key")
-        value_obj = item.get("value", {})
-        value = value_obj.get("stringValue")
-        if value is None and "intValue" in value_obj:
-            value = value_obj.get("intValue")
-        if value is None and "doubleValue" in value_obj:
-            value = value_obj.get("doubleValue")
-        if value is None and "boolValue" in value_obj:
-            value = value_obj.get("boolValue")
-        if key is not None and value is not None:
-            attrs[str(key)] = str(value)
-    return attrs
 
+def _filter_attributes(
+    span: dict[str, Any], pattern_re: re.Pattern[str] | None
+) -> dict[str, Any]:
+    """Keep only attributes whose key matches *pattern_re*.
 
-def _filter_attributes(span: dict[str, Any], patterns: list[str]) -> dict[str, Any]:
-    if not patterns:
+    The span is updated in place: spans come straight from
+    ``_fetch_traces_raw`` and are not shared with anything else.
+    """
+    if pattern_re is None:
         return span
+    match = pattern_re.match
     attributes = span.get("attributes", [])
-    filtered = [
-        item
-        for item in attributes
-        if any(
-            _matches_pattern(str(item.get("key", "")), pattern) for pattern in patterns
-        )
+    span["attributes"] = [
+        item for item in attributes if match(str(item.get("key", "")))
     ]
-    cloned = dict(span)
-    cloned["attributes"] = filtered
-    return cloned
+    return span
 
 
 def _filter_traces(
@@ -254,21 +217,41 @@ def _filter_traces(
     filter_patterns: list[str],
     where_filters: list[tuple[str, str]],
     since_seconds: int | None,
-) -> tuple[list[dict[str, Any]], list[str]]:
-    now_nanos = int(time.time() * 1_000_000_000)
+) -> tuple[list[dict[str, Any]], list[str], set[str]]:
+    """Apply the --since/--filter/--where options to *traces*.
+
+    Returns the matching traces, their IDs, and every attribute key seen in
+    the unfiltered input (used for the --where/--filter diagnostics; only
+    collected when one of those options is given).
+    """
+    if not (filter_patterns or where_filters or since_seconds):
+        # Nothing to filter (e.g. plain --list): skip the per-span walk.
+        filtered_traces = [trace for trace in traces if trace.get("spans")]
+        trace_ids = [trace.get("trace_id", "") for trace in filtered_traces]
+        return filtered_traces, trace_ids, set()
+
+    now_nanos = time.time_ns()
     since_nanos = now_nanos - (since_seconds * 1_000_000_000) if since_seconds else None
 
+    pattern_re = _compile_patterns(filter_patterns) if filter_patterns else None
+    collect_keys = bool(filter_patterns or where_filters)
+
+    available_keys: set[str] = set()
     filtered_traces: list[dict[str, Any]] = []
     for trace in traces:
-        spans = trace.get("spans", []) or []
-        if since_nanos is not None:
-            spans = [
-                span
-                for span in spans
-                if _safe_int(span.get("startTimeUnixNano", 0)) >= since_nanos
-            ]
-        if filter_patterns:
-            spans = [_filter_attributes(span, filter_patterns) for span in spans]
+        spans: list[dict[str, Any]] = []
+        for span in trace.get("spans", []) or []:
+            if collect_keys:
+                for item in span.get("attributes", []):
+                    key = item.get("key")
+                    if key:
+                        available_keys.add(str(key))
+            if (
+                since_nanos is not None
+                and _safe_int(span.get("startTimeUnixNano", 0)) < since_nanos
+            ):
+                continue
+            spans.append(_filter_attributes(span, pattern_re))
         if not spans:
             continue
 
@@ -278,19 +261,21 @@ def _filter_traces(
 
     if where_filters:
 
+        wanted = frozenset(where_filters)
+
         def matches_where(trace: dict[str, Any]) -> bool:
-            for key, value in where_filters:
-                if not any(
-                    _attribute_map(span).get(key) == value
-                    for span in trace.get("spans", [])
-                ):
-                    return False
-            return True
+            # Cross off (key, value) pairs span by span; stop once all are seen.
+            missing = set(wanted)
+            for span in trace.get("spans", []):
+                missing.difference_update(_attrs(span).items())
+                if not missing:
+                    return True
+            return False
 
         filtered_traces = [trace for trace in filtered_traces if matches_where(trace)]
 
     trace_ids = [trace.get("trace_id", "") for trace in filtered_traces]
-    return filtered_traces, trace_ids
+    return filtered_traces, trace_ids, available_keys
 
 
 class _TraceStore:
@@ -312,6 +297,8 @@ class _TraceStore:
         self._parent_to_group: dict[str, str] = {}
         self._max_traces = max_traces
         self._lock = threading.Lock()
+        # Encoded GetTraces response body; cleared whenever spans change.
+        self._encoded: bytes | None = None
 
     def _evict_oldest(self) -> None:
         """Remove the oldest trace group (caller must hold *_lock*)."""
@@ -345,69 +332,86 @@ class _TraceStore:
             if gid == src_key:
                 self._parent_to_group[pid] = dst_key
 
-    def merge_spans(self, trace_id: str, spans: list[dict[str, Any]]) -> None:
-        """Merge *spans* into the correct trace group.
+    def merge_batch(self, spans: list[dict[str, Any]]) -> None:
+        """Merge every span of one export request under a single lock hold.
 
-        The group is determined by following ``parentSpanId`` /
-        ``spanId`` links, falling back to *trace_id* when no link
-        exists.
+        Each span falls back to its own ``traceId`` when no parent/child
+        link places it in an existing group.
         """
         with self._lock:
+            self._encoded = None
             for span in spans:
-                span_id = span.get("spanId", "")
-                parent_id = span.get("parentSpanId", "")
-
-                # Determine which group this span belongs to.
-                group_key: str | None = None
-
-                # 1. Does the parent already live in a group?
-                if parent_id and parent_id in self._span_to_group:
-                    group_key = self._span_to_group[parent_id]
-
-                # 2. Is this span already known as a parent of another group?
-                if group_key is None and span_id and span_id in self._parent_to_group:
-                    group_key = self._parent_to_group.pop(span_id)
-
-                # 3. Fall back to the wire trace_id.
-                if group_key is None:
-                    group_key = trace_id
-
-                # Create the group if needed.
-                if group_key not in self._traces:
-                    if len(self._traces) >= self._max_traces:
-                        self._evict_oldest()
-                    self._traces[group_key] = {"trace_id": group_key, "spans": []}
-                    self._seen_spans[group_key] = set()
-                else:
-                    self._traces.move_to_end(group_key)
-
-                # Insert span (deduplicate).
-                seen = self._seen_spans[group_key]
-                if span_id and span_id in seen:
-                    continue
-                if span_id:
-                    seen.add(span_id)
-                    self._span_to_group[span_id] = group_key
-                if len(self._traces[group_key]["spans"]) < MAX_SPANS_PER_TRACE:
-                    self._traces[group_key]["spans"].append(span)
-
-                # Record parent link so future spans can find this group.
-                if parent_id and parent_id not in self._span_to_group:
-                    self._parent_to_group[parent_id] = group_key
-
-                # If this span's span_id is the parent of an existing
-                # *different* group, merge that group into this one.
-                if span_id and span_id in self._parent_to_group:
-                    other = self._parent_to_group.pop(span_id)
-                    if other != group_key and other in self._traces:
-                        self._merge_groups(other, group_key)
-
-    def snapshot(self) -> list[dict[str, Any]]:
-        """Return traces ordered newest-first."""
+                self._merge_span(span["traceId"], span)
+
+    def _merge_span(self, trace_id: str, span: dict[str, Any]) -> None:
+        """Merge a single span (caller must hold *_lock*)."""
+        span_id = span.get("spanId", "")
+        parent_id = span.get("parentSpanId", "")
+
+        # Determine which group this span belongs to.
+        group_key: str | None = None
+
+        # 1. Does the parent already live in a group?
+        if parent_id and parent_id in self._span_to_group:
+            group_key = self._span_to_group[parent_id]
+
+        # 2. Is this span already known as a parent of another group?
+        if group_key is None and span_id and span_id in self._parent_to_group:
+            group_key = self._parent_to_group.pop(span_id)
+
+        # 3. Fall back to the wire trace_id.
+        if group_key is None:
+            group_key = trace_id
+
+        # Create the group if needed.
+        if group_key not in self._traces:
+            if len(self._traces) >= self._max_traces:
+                self._evict_oldest()
+            self._traces[group_key] = {"trace_id": group_key, "spans": []}
+            self._seen_spans[group_key] = set()
+        else:
+            self._traces.move_to_end(group_key)
+
+        # Insert span (deduplicate).
+        seen = self._seen_spans[group_key]
+        if span_id and span_id in seen:
+            return
+        if span_id:
+            seen.add(span_id)
+            self._span_to_group[span_id] = group_key
+        if len(self._traces[group_key]["spans"]) < MAX_SPANS_PER_TRACE:
+            self._traces[group_key]["spans"].append(span)
+
+        # Record parent link so future spans can find this group.
+        if parent_id and parent_id not in self._span_to_group:
+            self._parent_to_group[parent_id] = group_key
+
+        # If this span's span_id is the parent of an existing
+        # *different* group, merge that group into this one.
+        if span_id and span_id in self._parent_to_group:
+            other = self._parent_to_group.pop(span_id)
+            if other != group_key and other in self._traces:
+                self._merge_groups(other, group_key)
+
+    def snapshot_json(self) -> bytes:
+        """Return the ``{"traces": [...]}`` response body, newest-first.
+
+        The body is encoded once per change to the store rather than on
+        every query, and under the lock so it never observes a partial merge.
+        Queries between changes read the published body without locking;
+        the attribute read is atomic and the bytes are never mutated.
+        """
+        encoded = self._encoded
+        if encoded is not None:
+            return encoded
         with self._lock:
-            traces = list(self._traces.values())
-        traces.reverse()
-        return traces
+            if self._encoded is None:
+                traces = list(self._traces.values())
+                traces.reverse()
+                self._encoded = json.dumps(
+                    {"traces": traces}, separators=(",", ":")
+                ).encode("utf-8")
+            return self._encoded
 
 
 _TRACE_STORE = _TraceStore()
@@ -461,6 +465,7 @@ class _OTLPTraceServicer(trace_service_pb2_grpc.TraceServiceServicer):
     merges incoming spans into the global _TRACE_STORE by trace_id."""
 
     def Export(self, request, context):  # noqa: N802
+        batch: list[dict[str, Any]] = []
         for resource_spans in request.resource_spans:
             service_name = "unknown"
             for attr in resource_spans.resource.attributes:
@@ -472,12 +477,12 @@ class _OTLPTraceServicer(trace_service_pb2_grpc.TraceServiceServicer):
 
             for scope_spans in resource_spans.scope_spans:
                 for span in scope_spans.spans:
-                    trace_id = span.trace_id.hex()
-                    if not trace_id:
+                    if not span.trace_id:
                         continue
-                    span_dict = _proto_span_to_dict(span, service_name)
-                    _TRACE_STORE.merge_spans(trace_id, [span_dict])
+                    batch.append(_proto_span_to_dict(span, service_name))
 
+        if batch:
+            _TRACE_STORE.merge_batch(batch)
         return trace_service_pb2.ExportTraceServiceResponse()
 
 
@@ -495,8 +500,7 @@ class _TraceQueryHandler(grpc.GenericRpcHandler):
 
     @staticmethod
     def _get_traces(_request, _context):
-        traces = _TRACE_STORE.snapshot()
-        return json.dumps({"traces": traces}, separators=(",", ":")).encode("utf-8")
+        return _TRACE_STORE.snapshot_json()
 
 
 def _start_trace_server(host: str, grpc_port: int) -> grpc.Server:
@@ -605,42 +609,58 @@ def start_trace_listener_background(
     return _start_trace_server(host, grpc_port)
 
 
-def _span_time_ns(span: dict[str, Any], key: str) -> int:
-    try:
-        return int(span.get(key, 0))
-    except (TypeError, ValueError):
-        return 0
-
-
 def _trace_id_short(trace_id: str) -> str:
     return trace_id[:8] if trace_id else "unknown"
 
 
+def _span_times(spans: list[dict[str, Any]]) -> tuple[list[int], list[int]]:
+    """Return span start and end times (ns) as two lists parallel to *spans*.
+
+    Both timestamps are parsed in a single walk with the int conversion
+    inlined; unparseable values count as 0.
+    """
+    starts: list[int] = []
+    ends: list[int] = []
+    for span in spans:
+        try:
+            start = int(span.get("startTimeUnixNano", 0))
+        except (TypeError, ValueError):
+            start = 0
+        try:
+            end = int(span.get("endTimeUnixNano", 0))
+        except (TypeError, ValueError):
+            end = 0
+        starts.append(start)
+        ends.append(end)
+    return starts, ends
+
+
 def _trace_summary(trace: dict[str, Any]) -> TraceSummary:
-    spans = trace.get("spans", [])
-    start_ns = min((_span_time_ns(s, "startTimeUnixNano") for s in spans), default=0)
-    end_ns = max((_span_time_ns(s, "endTimeUnixNano") for s in spans), default=0)
+    starts, ends = _span_times(trace.get("spans", []))
     return TraceSummary(
         trace_id=trace.get("trace_id", "unknown"),
-        start_ns=start_ns,
-        end_ns=end_ns,
+        start_ns=min(starts, default=0),
+        end_ns=max(ends, default=0),
     )
 
 
+# Checked in order: the first marker contained in the service name wins.
+_SERVICE_COLORS = (
+    ("inbound", "#4860fa"),
+    ("outbound", "#57d9a9"),
+    ("orchestrator", PLANO_COLOR),
+    ("routing", "#e3a2fa"),
+    ("agent", "cyan"),
+    ("llm", "green"),
+)
+
+
+@lru_cache(maxsize=256)
 def _service_color(service: str) -> str:
     service = service.lower()
-    if "inbound" in service:
-        return "#4860fa"
-    if "outbound" in service:
-        return "#57d9a9"
-    if "orchestrator" in service:
-        return PLANO_COLOR
-    if "routing" in service:
-        return "#e3a2fa"
-    if "agent" in service:
-        return "cyan"
-    if "llm" in service:
-        return "green"
+    for marker, color in _SERVICE_COLORS:
+        if marker in service:
+            return color
     return "white"
 
 
@@ -677,13 +697,12 @@ def _error_description(status_code: str) -> str:
         return "Client Error"
 
 
-def _detect_error(span: dict[str, Any]) -> tuple[bool, str, str]:
-    """Detect if span has an error and return (has_error, status_code, error_msg).
+def _detect_error(attrs: dict[str, str]) -> tuple[bool, str, str]:
+    """Detect if a span's parsed attributes show an error.
 
     Returns:
         tuple: (has_error, status_code, error_description)
     """
-    attrs = _attrs(span)
     status_code = attrs.get("http.status_code", "")
 
     # Check for non-2xx status codes
@@ -723,45 +742,52 @@ def _trim_attrs_for_display(
     return {k: v for k, v in attrs.items() if k != "service.name.override"}
 
 
-def _sorted_attr_items(attrs: dict[str, str]) -> list[tuple[str, str]]:
-    # Error attributes always come first
-    error_priority = [
-        "http.status_code",
-        "error.type",
-        "error.message",
-        "error.stack",
-        "exception.type",
-        "exception.message",
-    ]
+# Error attributes always come first, then regular priority attributes;
+# everything else follows alphabetically.
+_ATTR_PRIORITY = {
+    key: index
+    for index, key in enumerate(
+        (
+            "http.status_code",
+            "error.type",
+            "error.message",
+            "error.stack",
+            "exception.type",
+            "exception.message",
+            "http.method",
+            "http.target",
+            "guid:x-request-id",
+            "request_size",
+            "response_size",
+            "routing.determination_ms",
+            "route.selected_model",
+            "selection.agents",
+            "selection.agent_count",
+            "agent.name",
+            "agent.sequence",
+            "duration_ms",
+            "llm.model",
+            "llm.is_streaming",
+            "llm.time_to_first_token",
+            "llm.duration_ms",
+            "llm.response_bytes",
+        )
+    )
+}
 
-    # Then regular priority attributes
-    priority = [
-        "http.method",
-        "http.target",
-        "guid:x-request-id",
-        "request_size",
-        "response_size",
-        "routing.determination_ms",
-        "route.selected_model",
-        "selection.agents",
-        "selection.agent_count",
-        "agent.name",
-        "agent.sequence",
-        "duration_ms",
-        "llm.model",
-        "llm.is_streaming",
-        "llm.time_to_first_token",
-        "llm.duration_ms",
-        "llm.response_bytes",
-    ]
 
-    # Combine error priority with regular priority
-    full_priority = error_priority + priority
-    prioritized = [(k, attrs[k]) for k in full_priority if k in attrs]
-    prioritized_keys = {k for k, _ in prioritized}
-    remaining = [(k, v) for k, v in attrs.items() if k not in prioritized_keys]
-    remaining.sort(key=lambda item: item[0])
-    return prioritized + remaining
+# Attribute values rendered in red.
+_ERROR_ATTR_KEYS = frozenset(
+    ("error.message", "exception.message", "error.type", "exception.type")
+)
+
+
+def _attr_sort_key(item: tuple[str, str]) -> tuple[int, str]:
+    return _ATTR_PRIORITY.get(item[0], len(_ATTR_PRIORITY)), item[0]
+
+
+def _sorted_attr_items(attrs: dict[str, str]) -> list[tuple[str, str]]:
+    return sorted(attrs.items(), key=_attr_sort_key)
 
 
 def _display_attr_value(key: str, value: str) -> str:
@@ -782,76 +808,89 @@ def _build_tree(trace: dict[str, Any], console: Console, verbose: bool = False)
         console.print("[yellow]No spans found for this trace.[/yellow]")
         return
 
-    start_ns = min((_span_time_ns(s, "startTimeUnixNano") for s in spans), default=0)
-    end_ns = max((_span_time_ns(s, "endTimeUnixNano") for s in spans), default=0)
+    starts, ends = _span_times(spans)
+    start_ns = min(starts)
+    end_ns = max(ends)
     total_ms = max(0, (end_ns - start_ns) / 1_000_000)
 
     trace_id = trace.get("trace_id", "unknown")
-    console.print(
+    header = console.render_str(
         f"\n[bold]Trace:[/bold] {trace_id} [dim]({total_ms:.0f}ms total)[/dim]\n"
     )
 
-    spans.sort(key=lambda s: _span_time_ns(s, "startTimeUnixNano"))
+    attr_value_style = f"{PLANO_COLOR} bold"
+
+    # Order spans by the start times parsed above instead of re-parsing them.
+    order = sorted(range(len(spans)), key=starts.__getitem__)
     tree = Tree("", guide_style="dim #5b5a5c bold")
 
-    for span in spans:
+    for span_idx in order:
+        span = spans[span_idx]
         service = span.get("service", "plano(unknown)")
         name = span.get("name", "")
-        offset_ms = max(
-            0, (_span_time_ns(span, "startTimeUnixNano") - start_ns) / 1_000_000
-        )
+        offset_ms = max(0, (starts[span_idx] - start_ns) / 1_000_000)
 
         # Check for errors in this span
-        has_error, error_code, error_desc = _detect_error(span)
+        span_attrs = _attrs(span)
+        has_error, error_code, error_desc = _detect_error(span_attrs)
 
         if has_error:
             # Create error banner above the span
-            error_banner = Text()
-            error_banner.append(error_desc, style="bright_red")
-            tree.add(error_banner)
+            tree.add(Text.assemble((error_desc, "bright_red")))
 
             # Style the span label in light red
-            label = Text(f"{offset_ms:.0f}ms ", style="#ff6b6b")
-            label.append(service, style="bold #ff6b6b")
-            if name:
-                label.append(f" {name}", style="#ff6b6b italic")
+            label = Text.assemble(
+                f"{offset_ms:.0f}ms ",
+                (service, "bold #ff6b6b"),
+                (f" {name}", "#ff6b6b italic") if name else "",
+                style="#ff6b6b",
+            )
         else:
             # Normal styling
             color = _service_color(service)
-            label = Text(f"{offset_ms:.0f}ms ", style="#949c99")
-            label.append(service, style=f"bold {color}")
-            if name:
-                label.append(f" {name}", style="dim white bold italic")
+            label = Text.assemble(
+                f"{offset_ms:.0f}ms ",
+                (service, f"bold {color}"),
+                (f" {name}", "dim white bold italic") if name else "",
+                style="#949c99",
+            )
 
         node = tree.add(label)
-        attrs = _trim_attrs_for_display(_attrs(span), service, verbose)
+        attrs = _trim_attrs_for_display(span_attrs, service, verbose)
         sorted_items = list(_sorted_attr_items(attrs))
+        last_idx = len(sorted_items) - 1
         for idx, (key, value) in enumerate(sorted_items):
-            attr_line = Text()
-            # attribute key
-            attr_line.append(f"{key}: ", style="#a4a9aa")
-            # attribute value
             if key == "http.status_code" and value.isdigit():
-                val_int = int(value)
-                val_style = "bold red" if val_int >= 400 else "green"
-                attr_line.append(_display_attr_value(key, str(value)), style=val_style)
-            elif key in [
-                "error.message",
-                "exception.message",
-                "error.type",
-                "exception.type",
-            ]:
-                attr_line.append(_display_attr_value(key, str(value)), style="red")
+                val_style = "bold red" if int(value) >= 400 else "green"
+            elif key in _ERROR_ATTR_KEYS:
+                val_style = "red"
             else:
-                attr_line.append(
-                    _display_attr_value(key, str(value)), style=f"{PLANO_COLOR} bold"
+                val_style = attr_value_style
+            node.add(
+                Text.assemble(
+                    (f"{key}: ", "#a4a9aa"),
+                    (_display_attr_value(key, value), val_style),
+                    "\n" if idx == last_idx else "",
                 )
-            if idx == len(sorted_items) - 1:
-                attr_line.append("\n")
-            node.add(attr_line)
+            )
+
+    # Emit header, tree and trailing blank line as one render/write.
+    console.print(Group(header, tree, Text()))
 
-    console.print(tree)
-    console.print()
+
+def _print_json(console: Console, payload: dict[str, Any]) -> None:
+    """Print *payload* as indented JSON.
+
+    Terminals get Rich's highlighted output; when piped, the encoded bytes
+    are written straight to stdout without Rich's rendering pass.
+    """
+    if console.is_terminal:
+        console.print_json(data=payload)
+        return
+    body = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(body + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def _select_request(
@@ -968,18 +1007,20 @@ def _run_trace_show(
     if isinstance(target, str) and target not in ("last", "any"):
         target_lower = target.lower()
         if len(target_lower) == 8:
-            if not _is_hex(target_lower, 8) or target_lower == "00000000":
+            if not _is_hex(target_lower, 8) or int(target_lower, 16) == 0:
                 raise click.ClickException("Short trace ID must be 8 hex characters.")
             short_target = target_lower
         elif len(target_lower) == 32:
-            if not _is_hex(target_lower, 32) or target_lower == "0" * 32:
+            if not _is_hex(target_lower, 32) or int(target_lower, 16) == 0:
                 raise click.ClickException("Trace ID must be 32 hex characters.")
         else:
             raise click.ClickException("Trace ID must be 8 or 32 hex characters.")
 
     traces_raw = _fetch_traces_raw()
+    traces, trace_ids, available_keys = _filter_traces(
+        traces_raw, patterns, parsed_where, since_seconds
+    )
     if traces_raw:
-        available_keys = _collect_attr_keys(traces_raw)
         if parsed_where:
             missing_keys = [key for key, _ in parsed_where if key not in available_keys]
             if missing_keys:
@@ -989,7 +1030,7 @@ def _run_trace_show(
             unmatched = [
                 pattern
                 for pattern in patterns
-                if not any(fnmatch(key, pattern) for key in available_keys)
+                if not any(map(_compile_patterns([pattern]).match, available_keys))
             ]
             if unmatched:
                 unmatched_list = ", ".join(unmatched)
@@ -998,10 +1039,6 @@ def _run_trace_show(
                     "Returning unfiltered traces."
                 )
 
-    traces, trace_ids = _filter_traces(
-        traces_raw, patterns, parsed_where, since_seconds
-    )
-
     if target == "last":
         traces = traces[:1]
         trace_ids = trace_ids[:1]
@@ -1024,9 +1061,9 @@ def _run_trace_show(
 
     if json_out:
         if list_only:
-            console.print_json(data={"trace_ids": trace_ids})
+            _print_json(console, {"trace_ids": trace_ids})
         else:
-            console.print_json(data={"traces": traces})
+            _print_json(console, {"traces": traces})
         return
 
     if list_only:
@@ -1037,15 +1074,15 @@ def _run_trace_show(
             return
 
         if traces:
-            trace_ids = [_trace_id_short(_trace_summary(t).trace_id) for t in traces]
+            trace_ids = [_trace_id_short(t.get("trace_id", "unknown")) for t in traces]
 
         if not trace_ids:
             console.print("[yellow]No trace IDs found.[/yellow]")
             return
 
-        console.print("\n[bold]Trace IDs:[/bold]")
-        for trace_id in trace_ids:
-            console.print(f"  [dim]-[/dim] {trace_id}")
+        lines = ["\n[bold]Trace IDs:[/bold]"]
+        lines.extend(f"  [dim]-[/dim] {trace_id}" for trace_id in trace_ids)
+        console.print("\n".join(lines))
         return
 
     if not traces:
@@ -25,15 +25,14 @@ def write_listener_pid(pid: int) -> None:
 def remove_listener_pid() -> None:
     """Remove persisted listener PID file if present."""
     # Best-effort cleanup; missing file is not an error.
-    if os.path.exists(TRACE_LISTENER_PID_PATH):
+    try:
         os.remove(TRACE_LISTENER_PID_PATH)
+    except FileNotFoundError:
+        pass
 
 
 def get_listener_pid() -> int | None:
     """Return listener PID if present and process is alive."""
-    if not os.path.exists(TRACE_LISTENER_PID_PATH):
-        return None
-
     try:
         # Parse persisted PID.
         with open(TRACE_LISTENER_PID_PATH, "r") as f:
@@ -41,6 +40,9 @@ def get_listener_pid() -> int | None:
         # Signal 0 performs liveness check without sending a real signal.
         os.kill(pid, 0)
         return pid
+    except FileNotFoundError:
+        # No PID file: no listener has been started.
+        return None
     except (ValueError, ProcessLookupError, OSError):
         # Stale or malformed PID file: clean it up to prevent repeated confusion.
         LOGGER.warning(
@@ -60,15 +62,23 @@ def stop_listener_process(grace_seconds: float = 0.5) -> bool:
     try:
         # Try graceful shutdown first.
         os.kill(pid, signal.SIGTERM)
-        # Allow the process a short window to exit cleanly.
-        time.sleep(grace_seconds)
-        try:
-            # If still alive, force terminate.
-            os.kill(pid, 0)
-            os.kill(pid, signal.SIGKILL)
-        except ProcessLookupError:
-            # Already exited after SIGTERM.
-            pass
+        # Allow the process a short window to exit cleanly, returning as
+        # soon as it is gone instead of always sleeping the full grace period.
+        deadline = time.monotonic() + grace_seconds
+        while True:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                # Exited after SIGTERM.
+                break
+            if time.monotonic() >= deadline:
+                try:
+                    # Still alive: force terminate.
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                break
+            time.sleep(0.01)
         remove_listener_pid()
         return True
     except ProcessLookupError:
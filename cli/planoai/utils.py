@@ -6,6 +6,11 @@ import yaml
 import logging
 from planoai.consts import PLANO_DOCKER_NAME
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as YamlLoader
+
 # Standard env var for log level across all Plano components
 LOG_LEVEL_ENV = "LOG_LEVEL"
 
@@ -71,7 +76,7 @@ def has_ingress_listener(plano_config_file):
     """Check if the plano config file has ingress_traffic listener configured."""
     try:
         with open(plano_config_file) as f:
-            plano_config_dict = yaml.safe_load(f)
+            plano_config_dict = yaml.load(f, Loader=YamlLoader)
 
         ingress_traffic = plano_config_dict.get("listeners", {}).get(
             "ingress_traffic", {}
@@ -171,7 +176,7 @@ def convert_legacy_listeners(
 def get_llm_provider_access_keys(plano_config_file):
     with open(plano_config_file, "r") as file:
         plano_config = file.read()
-        plano_config_yaml = yaml.safe_load(plano_config)
+        plano_config_yaml = yaml.load(plano_config, Loader=YamlLoader)
 
     access_key_list = []
 
@@ -1,4 +1,3 @@
-import importlib.metadata
 import re
 
 PYPI_PACKAGE_NAME = "planoai"
@@ -6,6 +5,8 @@ PYPI_URL = f"https://pypi.org/pypi/{PYPI_PACKAGE_NAME}/json"
 
 
 def get_version() -> str:
+    import importlib.metadata
+
     try:
         # First try package metadata (installed package).
         return importlib.metadata.version(PYPI_PACKAGE_NAME)
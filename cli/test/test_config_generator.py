@@ -1,6 +1,8 @@
 import json
+import os
 import pytest
 import yaml
+from pathlib import Path
 from unittest import mock
 from planoai.config_generator import (
     apply_kimi_code_provider_defaults,
@@ -9,6 +11,40 @@ from planoai.config_generator import (
     validate_and_render_schema,
 )
 
+PLANO_CONFIG_SCHEMA_PATH = (
+    Path(__file__).resolve().parents[2] / "config" / "plano_config_schema.yaml"
+)
+
+
+@pytest.fixture(scope="session")
+def plano_config_schema():
+    # The schema text is identical for every test; read it once per session.
+    return PLANO_CONFIG_SCHEMA_PATH.read_text()
+
+
+@pytest.fixture
+def mock_template_environment():
+    # Template rendering is not under test.
+    with mock.patch("planoai.config_generator.Environment") as environment:
+        yield environment
+
+
+VALIDATE_AND_RENDER_ENV = {
+    "PLANO_CONFIG_FILE": "fake_plano_config.yaml",
+    "PLANO_CONFIG_SCHEMA_FILE": "fake_plano_config_schema.yaml",
+    "ENVOY_CONFIG_TEMPLATE_FILE": "./envoy.template.yaml",
+    "PLANO_CONFIG_FILE_RENDERED": "fake_plano_config_rendered.yaml",
+    "ENVOY_CONFIG_FILE_RENDERED": "fake_envoy.yaml",
+    "TEMPLATE_ROOT": "../",
+}
+
+
+@pytest.fixture
+def validate_and_render_env():
+    # Set every path validate_and_render_schema reads in one patch.
+    with mock.patch.dict(os.environ, VALIDATE_AND_RENDER_ENV):
+        yield
+
 
 @pytest.fixture(autouse=True)
 def cleanup_env(monkeypatch):
@@ -17,15 +53,7 @@ def cleanup_env(monkeypatch):
     monkeypatch.undo()
 
 
-def test_validate_and_render_happy_path(monkeypatch):
-    monkeypatch.setenv("PLANO_CONFIG_FILE", "fake_plano_config.yaml")
-    monkeypatch.setenv("PLANO_CONFIG_SCHEMA_FILE", "fake_plano_config_schema.yaml")
-    monkeypatch.setenv("ENVOY_CONFIG_TEMPLATE_FILE", "./envoy.template.yaml")
-    monkeypatch.setenv("PLANO_CONFIG_FILE_RENDERED", "fake_plano_config_rendered.yaml")
-    monkeypatch.setenv("ENVOY_CONFIG_FILE_RENDERED", "fake_envoy.yaml")
-    monkeypatch.setenv("TEMPLATE_ROOT", "../")
-
-    plano_config = """
+LEGACY_PROVIDERS_CONFIG = """
 version: v0.1.0
 
 listeners:
@@ -56,39 +84,8 @@ llm_providers:
 tracing:
   random_sampling: 100
 """
-    plano_config_schema = ""
-    with open("../config/plano_config_schema.yaml", "r") as file:
-        plano_config_schema = file.read()
 
-    m_open = mock.mock_open()
-    # Provide enough file handles for all open() calls in validate_and_render_schema
-    m_open.side_effect = [
-        # Removed empty read - was causing validation failures
-        mock.mock_open(read_data=plano_config).return_value,  # PLANO_CONFIG_FILE
-        mock.mock_open(
-            read_data=plano_config_schema
-        ).return_value,  # PLANO_CONFIG_SCHEMA_FILE
-        mock.mock_open(read_data=plano_config).return_value,  # PLANO_CONFIG_FILE
-        mock.mock_open(
-            read_data=plano_config_schema
-        ).return_value,  # PLANO_CONFIG_SCHEMA_FILE
-        mock.mock_open().return_value,  # ENVOY_CONFIG_FILE_RENDERED (write)
-        mock.mock_open().return_value,  # PLANO_CONFIG_FILE_RENDERED (write)
-    ]
-    with mock.patch("builtins.open", m_open):
-        with mock.patch("planoai.config_generator.Environment"):
-            validate_and_render_schema()
-
-
-def test_validate_and_render_happy_path_agent_config(monkeypatch):
-    monkeypatch.setenv("PLANO_CONFIG_FILE", "fake_plano_config.yaml")
-    monkeypatch.setenv("PLANO_CONFIG_SCHEMA_FILE", "fake_plano_config_schema.yaml")
-    monkeypatch.setenv("ENVOY_CONFIG_TEMPLATE_FILE", "./envoy.template.yaml")
-    monkeypatch.setenv("PLANO_CONFIG_FILE_RENDERED", "fake_plano_config_rendered.yaml")
-    monkeypatch.setenv("ENVOY_CONFIG_FILE_RENDERED", "fake_envoy.yaml")
-    monkeypatch.setenv("TEMPLATE_ROOT", "../")
-
-    plano_config = """
+AGENT_CONFIG = """
 version: v0.3.0
 
 agents:
@@ -129,10 +126,20 @@ model_providers:
   - access_key: ${OPENAI_API_KEY}
     model: openai/gpt-4o
 """
-    plano_config_schema = ""
-    with open("../config/plano_config_schema.yaml", "r") as file:
-        plano_config_schema = file.read()
 
+happy_path_configs = [
+    pytest.param(LEGACY_PROVIDERS_CONFIG, id="legacy_llm_providers"),
+    pytest.param(AGENT_CONFIG, id="agent_config"),
+]
+
+
+@pytest.mark.parametrize("plano_config", happy_path_configs)
+def test_validate_and_render_happy_path(
+    validate_and_render_env,
+    plano_config,
+    plano_config_schema,
+    mock_template_environment,
+):
     m_open = mock.mock_open()
     # Provide enough file handles for all open() calls in validate_and_render_schema
     m_open.side_effect = [
@@ -142,15 +149,11 @@ model_providers:
             read_data=plano_config_schema
         ).return_value,  # PLANO_CONFIG_SCHEMA_FILE
         mock.mock_open(read_data=plano_config).return_value,  # PLANO_CONFIG_FILE
-        mock.mock_open(
-            read_data=plano_config_schema
-        ).return_value,  # PLANO_CONFIG_SCHEMA_FILE
         mock.mock_open().return_value,  # ENVOY_CONFIG_FILE_RENDERED (write)
         mock.mock_open().return_value,  # PLANO_CONFIG_FILE_RENDERED (write)
     ]
     with mock.patch("builtins.open", m_open):
-        with mock.patch("planoai.config_generator.Environment"):
-            validate_and_render_schema()
+        validate_and_render_schema()
 
 
 plano_config_test_cases = [
@@ -423,21 +426,15 @@ tracing:
     plano_config_test_cases,
     ids=[case["id"] for case in plano_config_test_cases],
 )
-def test_validate_and_render_schema_tests(monkeypatch, plano_config_test_case):
-    monkeypatch.setenv("PLANO_CONFIG_FILE", "fake_plano_config.yaml")
-    monkeypatch.setenv("PLANO_CONFIG_SCHEMA_FILE", "fake_plano_config_schema.yaml")
-    monkeypatch.setenv("ENVOY_CONFIG_TEMPLATE_FILE", "./envoy.template.yaml")
-    monkeypatch.setenv("PLANO_CONFIG_FILE_RENDERED", "fake_plano_config_rendered.yaml")
-    monkeypatch.setenv("ENVOY_CONFIG_FILE_RENDERED", "fake_envoy.yaml")
-    monkeypatch.setenv("TEMPLATE_ROOT", "../")
-
+def test_validate_and_render_schema_tests(
+    validate_and_render_env,
+    plano_config_test_case,
+    plano_config_schema,
+    mock_template_environment,
+):
     plano_config = plano_config_test_case["plano_config"]
     expected_error = plano_config_test_case.get("expected_error")
 
-    plano_config_schema = ""
-    with open("../config/plano_config_schema.yaml", "r") as file:
-        plano_config_schema = file.read()
-
     m_open = mock.mock_open()
     # Provide enough file handles for all open() calls in validate_and_render_schema
     m_open.side_effect = [
@@ -450,48 +447,55 @@ def test_validate_and_render_schema_tests(monkeypatch, plano_config_test_case):
         mock.mock_open(
             read_data=plano_config
         ).return_value,  # validate_and_render_schema: PLANO_CONFIG_FILE
-        mock.mock_open(
-            read_data=plano_config_schema
-        ).return_value,  # validate_and_render_schema: PLANO_CONFIG_SCHEMA_FILE
         mock.mock_open().return_value,  # ENVOY_CONFIG_FILE_RENDERED (write)
         mock.mock_open().return_value,  # PLANO_CONFIG_FILE_RENDERED (write)
     ]
     with mock.patch("builtins.open", m_open):
-        with mock.patch("planoai.config_generator.Environment"):
-            if expected_error:
-                # Test expects an error
-                with pytest.raises(Exception) as excinfo:
-                    validate_and_render_schema()
-                assert expected_error in str(excinfo.value)
-            else:
-                # Test expects success - no exception should be raised
+        if expected_error:
+            # Test expects an error
+            with pytest.raises(Exception) as excinfo:
                 validate_and_render_schema()
+            assert expected_error in str(excinfo.value)
+        else:
+            # Test expects success - no exception should be raised
+            validate_and_render_schema()
 
 
-def test_convert_legacy_llm_providers():
-    from planoai.utils import convert_legacy_listeners
+# convert_legacy_listeners only reads its inputs, so tests share these.
+LEGACY_LISTENERS = {
+    "ingress_traffic": {
+        "address": "0.0.0.0",
+        "port": 10000,
+        "timeout": "30s",
+    },
+    "egress_traffic": {
+        "address": "0.0.0.0",
+        "port": 12000,
+        "timeout": "30s",
+    },
+}
 
-    listeners = {
-        "ingress_traffic": {
-            "address": "0.0.0.0",
-            "port": 10000,
-            "timeout": "30s",
-        },
-        "egress_traffic": {
-            "address": "0.0.0.0",
-            "port": 12000,
-            "timeout": "30s",
-        },
+LEGACY_EGRESS_ONLY_LISTENERS = {
+    "egress_traffic": {
+        "address": "0.0.0.0",
+        "port": 12000,
+        "timeout": "30s",
     }
-    llm_providers = [
-        {
-            "model": "openai/gpt-4o",
-            "access_key": "test_key",
-        }
-    ]
+}
+
+LEGACY_LLM_PROVIDERS = [
+    {
+        "model": "openai/gpt-4o",
+        "access_key": "test_key",
+    }
+]
+
+
+def test_convert_legacy_llm_providers():
+    from planoai.utils import convert_legacy_listeners
 
     updated_providers, llm_gateway, prompt_gateway = convert_legacy_listeners(
-        listeners, llm_providers
+        LEGACY_LISTENERS, LEGACY_LLM_PROVIDERS
     )
     assert isinstance(updated_providers, list)
     assert llm_gateway is not None
@@ -541,22 +545,8 @@ def test_convert_legacy_llm_providers():
 def test_convert_legacy_llm_providers_no_prompt_gateway():
     from planoai.utils import convert_legacy_listeners
 
-    listeners = {
-        "egress_traffic": {
-            "address": "0.0.0.0",
-            "port": 12000,
-            "timeout": "30s",
-        }
-    }
-    llm_providers = [
-        {
-            "model": "openai/gpt-4o",
-            "access_key": "test_key",
-        }
-    ]
-
     updated_providers, llm_gateway, prompt_gateway = convert_legacy_listeners(
-        listeners, llm_providers
+        LEGACY_EGRESS_ONLY_LISTENERS, LEGACY_LLM_PROVIDERS
     )
     assert isinstance(updated_providers, list)
     assert llm_gateway is not None
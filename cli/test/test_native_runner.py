@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+from planoai.native_runner import _expand_env_vars
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param("key: $API_KEY", id="dollar_name"),
+        pytest.param("key: ${API_KEY}", id="braced_name"),
+        pytest.param("url: http://$HOST:${PORT}/v1", id="several_vars"),
+        pytest.param("key: $MISSING_VAR", id="unknown_name"),
+        pytest.param("key: ${MISSING_VAR}", id="unknown_braced_name"),
+        pytest.param("key: ${}", id="empty_braces"),
+        pytest.param("key: ${UNCLOSED", id="unclosed_brace"),
+        pytest.param("price: $ 5 and $", id="bare_dollar"),
+        pytest.param("key: $API_KEY_suffix", id="longer_name"),
+        pytest.param("shared: $SHARED", id="caller_env_wins"),
+    ],
+)
+def test_expand_env_vars_matches_expandvars(monkeypatch, text):
+    monkeypatch.setenv("API_KEY", "from-os")
+    monkeypatch.setenv("SHARED", "from-os")
+    monkeypatch.delenv("MISSING_VAR", raising=False)
+    monkeypatch.delenv("API_KEY_suffix", raising=False)
+    caller_env = {"HOST": "localhost", "PORT": "8080", "SHARED": "from-caller"}
+
+    expanded = _expand_env_vars(text, caller_env)
+
+    # envsubst semantics: caller env overrides os.environ.
+    monkeypatch.setattr(os, "environ", {**os.environ, **caller_env})
+    assert expanded == os.path.expandvars(text)
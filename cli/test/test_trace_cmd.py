@@ -92,6 +92,27 @@ def test_start_trace_server_raises_bind_error(monkeypatch):
     assert "planoai trace listen" in str(excinfo.value)
 
 
+def test_trace_store_snapshot_reflects_later_merges():
+    store = trace_cmd._TraceStore()
+    store.merge_batch([{"traceId": "t1", "spanId": "a", "parentSpanId": ""}])
+
+    first = json.loads(store.snapshot_json())
+    assert [t["trace_id"] for t in first["traces"]] == ["t1"]
+    assert store.snapshot_json() == store.snapshot_json()
+
+    # A child emitted under another traceId joins its parent's group.
+    store.merge_batch(
+        [
+            {"traceId": "t2", "spanId": "b", "parentSpanId": "a"},
+            {"traceId": "t3", "spanId": "c", "parentSpanId": ""},
+        ]
+    )
+
+    second = json.loads(store.snapshot_json())
+    assert [t["trace_id"] for t in second["traces"]] == ["t3", "t1"]
+    assert [span["spanId"] for span in second["traces"][1]["spans"]] == ["a", "b"]
+
+
 def test_trace_listen_starts_listener_with_defaults(runner, monkeypatch):
     seen = {}
 
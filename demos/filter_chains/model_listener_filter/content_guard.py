@@ -9,6 +9,7 @@ Receives the full raw request body (any API format: /v1/chat/completions,
 """
 
 import logging
+import re
 from typing import Any
 
 from fastapi import FastAPI, Request, HTTPException
@@ -37,14 +38,16 @@ BLOCKED_KEYWORDS = [
     "social engineering",
 ]
 
+# One alternation scans the message once instead of once per keyword.
+_BLOCKED_RE = re.compile(
+    "|".join(re.escape(kw) for kw in BLOCKED_KEYWORDS), re.IGNORECASE
+)
+
 
 def check_content(text: str) -> str | None:
     """Return the matched keyword if blocked, else None."""
-    lower = text.lower()
-    for kw in BLOCKED_KEYWORDS:
-        if kw in lower:
-            return kw
-    return None
+    match = _BLOCKED_RE.search(text)
+    return match.group(0).lower() if match else None
 
 
 def extract_last_user_text(body: dict[str, Any]) -> str | None:
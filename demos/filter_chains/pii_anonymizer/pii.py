@@ -1,41 +1,48 @@
 """PII detection and anonymization utilities."""
 
 import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Tuple
 
 # Order matters: SSN before phone to avoid overlap
 PII_PATTERNS = [
     ("SSN", re.compile(r"\b\d{3}-\d{2}-\d{4}\b")),
     ("CREDIT_CARD", re.compile(r"\b(?:\d{4}[-\s]?){3}\d{4}\b")),
-    ("EMAIL", re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")),
+    # Only start at the beginning of a local-part run, so long runs without "@"
+    # are scanned once instead of once per character.
+    (
+        "EMAIL",
+        re.compile(
+            r"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+        ),
+    ),
     ("PHONE", re.compile(r"(\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")),
 ]
 
 
+# All patterns in one alternation, tried in PII_PATTERNS order at each position,
+# so the text is scanned once and matches never overlap.
+_PII_RE = re.compile(
+    "|".join(f"(?P<{pii_type}>{pattern.pattern})" for pii_type, pattern in PII_PATTERNS)
+)
+
+
 def anonymize_text(text: str) -> Tuple[str, Dict[str, str]]:
     """Replace PII with [TYPE_N] placeholders. Returns (anonymized_text, mapping)."""
     mapping: Dict[str, str] = {}
     counters: Dict[str, int] = {}
-    matched_spans: List[Tuple[int, int]] = []
-
-    for pii_type, pattern in PII_PATTERNS:
-        for match in pattern.finditer(text):
-            start, end = match.start(), match.end()
-            if any(s <= start < e or s < end <= e for s, e in matched_spans):
-                continue
-            matched_spans.append((start, end))
-            idx = counters.get(pii_type, 0)
-            counters[pii_type] = idx + 1
-            mapping[f"[{pii_type}_{idx}]"] = match.group()
-
-    # Replace right-to-left to preserve span indices
-    matched_spans.sort(reverse=True)
-    result = text
-    for start, end in matched_spans:
-        placeholder = next(k for k, v in mapping.items() if v == text[start:end])
-        result = result[:start] + placeholder + result[end:]
-
-    return result, mapping
+    placeholders: Dict[str, str] = {}
+
+    def replace(match: re.Match) -> str:
+        pii_type = match.lastgroup
+        value = match.group()
+        idx = counters.get(pii_type, 0)
+        counters[pii_type] = idx + 1
+        placeholder = f"[{pii_type}_{idx}]"
+        mapping[placeholder] = value
+        # Repeated values reuse the placeholder of their first occurrence
+        return placeholders.setdefault(value, placeholder)
+
+    return _PII_RE.sub(replace, text), mapping
 
 
 def deanonymize_text(